@@ -1,3 +1,3 @@
-from .utils import is_stale, npm_builder
+from .utils import is_stale, make_builder, npm_builder
 
 __version__ = "0.8.3"
@@ -1,27 +1,70 @@
 """Utilities for hatch_jupyter_builder."""
 from __future__ import annotations
 
-import importlib
+import functools
 import logging
 import os
-import shlex
-import subprocess
 import sys
+from collections import deque
+from itertools import chain
 from pathlib import Path
 from shutil import which
-from typing import Any, Callable, Mapping, cast
+from typing import Any, Callable, Container, Iterator, Mapping, cast
 
-if sys.platform == "win32":  # pragma: no cover
-    from subprocess import list2cmdline
-else:
+# Heavier modules (importlib, shlex, subprocess, concurrent.futures) are
+# imported lazily at their call sites to keep module import fast on paths
+# that never spawn a subprocess, e.g. --skip-npm or ensure_targets-only use.
 
-    def list2cmdline(cmd_list: Any) -> str:
-        """Implementation of list2cmdline for posix systems."""
-        return " ".join(map(shlex.quote, cmd_list))
+
+def list2cmdline(cmd_list: Any) -> str:
+    """Shell-escape a command vector for display."""
+    if sys.platform == "win32":  # pragma: no cover
+        from subprocess import list2cmdline as impl
+    else:
+        from shlex import join as impl
+    return impl(cmd_list)
 
 
 _logger = None
 
+#: Name of the stamp file recording the last successful build in ``build_dir``.
+STAMP_FILE_NAME = ".hatch_jupyter_builder.stamp"
+
+#: Directory names pruned from mtime scans by default; these trees can be
+#: huge and cannot meaningfully affect staleness.
+SKIP_DIRNAMES = frozenset({"node_modules", ".git", ".venv", "__pycache__", "dist", "build"})
+
+_skip_npm_cli: bool | None = None
+
+
+def _skip_npm_requested() -> bool:
+    """Check for the --skip-npm CLI flag, scanning sys.argv only once.
+
+    The flag is removed from sys.argv the first time it is seen, so the
+    argv mutation happens exactly once per process rather than inside
+    every npm_builder call.
+    """
+    global _skip_npm_cli  # noqa: PLW0603
+    if _skip_npm_cli is None:
+        _skip_npm_cli = "--skip-npm" in sys.argv
+        if _skip_npm_cli:
+            sys.argv.remove("--skip-npm")
+    return _skip_npm_cli
+
+
+_which_cache: dict[tuple[str, str], str | None] = {}
+
+
+def _cached_which(name: str) -> str | None:
+    """Resolve an executable like shutil.which, caching per (name, PATH).
+
+    Keying on PATH makes invalidation automatic when it changes.
+    """
+    key = (name, os.environ.get("PATH", ""))
+    if key not in _which_cache:
+        _which_cache[key] = which(name)
+    return _which_cache[key]
+
 
 def _get_log() -> logging.Logger:
     global _logger  # noqa: PLW0603
@@ -34,7 +77,7 @@ def _get_log() -> logging.Logger:
 
 
 def npm_builder(
-    target_name: str,  # noqa: ARG001
+    target_name: str,
     version: str,
     path: str = ".",
     build_dir: str | None = None,
@@ -43,6 +86,7 @@ def npm_builder(
     force: bool = False,
     npm: str | list[Any] | None = None,
     editable_build_cmd: str | None = None,
+    parallel_cmds: list[str] | None = None,
 ) -> None:
     """Build function for managing an npm installation.
 
@@ -65,28 +109,56 @@ def npm_builder(
         The npm command to build assets to the build_dir when building in editable mode.
     npm: str or list, optional.
         The npm executable name, or a tuple of ['node', executable].
+    parallel_cmds: list, optional.
+        Independent npm commands to run concurrently after the install
+        step and before build_cmd, e.g. lint or asset preparation tasks.
 
     Notes
     -----
     The function is a no-op if the `--skip-npm` cli flag is used
         or HATCH_JUPYTER_BUILDER_SKIP_NPM env is set.
     """
-
+    make_builder(
+        target_name,
+        version,
+        path=path,
+        build_dir=build_dir,
+        source_dir=source_dir,
+        build_cmd=build_cmd,
+        force=force,
+        npm=npm,
+        editable_build_cmd=editable_build_cmd,
+        parallel_cmds=parallel_cmds,
+    )()
+
+
+def make_builder(
+    target_name: str,  # noqa: ARG001
+    version: str,
+    path: str = ".",
+    build_dir: str | None = None,
+    source_dir: str | None = None,
+    build_cmd: str | None = "build",
+    force: bool = False,
+    npm: str | list[Any] | None = None,
+    editable_build_cmd: str | None = None,
+    parallel_cmds: list[str] | None = None,
+) -> Callable[[], None]:
+    """Specialize a zero-argument npm builder for fixed arguments.
+
+    Path resolution, skip detection, npm/yarn lookup and command
+    normalization all happen here, once; the returned callable only
+    performs the staleness check and subprocess spawns, which makes it
+    cheap to invoke repeatedly (watch mode, repeated hatch phases).
+    Parameters are those of `npm_builder`.
+    """
     # Check if we are building a wheel from an sdist.
     abs_path = Path(path).resolve()
     log = _get_log()
 
-    if "--skip-npm" in sys.argv or os.environ.get("HATCH_JUPYTER_BUILDER_SKIP_NPM") == "1":
+    if _skip_npm_requested() or os.environ.get("HATCH_JUPYTER_BUILDER_SKIP_NPM") == "1":
         log.info("Skipping npm install as requested.")
-        skip_npm = True
-        if "--skip-npm" in sys.argv:
-            sys.argv.remove("--skip-npm")
-    else:
-        skip_npm = False
-
-    if skip_npm:
-        log.info("Skipping npm-installation")
-        return
+        return lambda: None
 
     if version == "editable":
         build_cmd = editable_build_cmd or build_cmd
@@ -96,8 +168,15 @@ def npm_builder(
 
     # Find a suitable default for the npm command.
     if npm is None:
-        is_yarn = (abs_path / "yarn.lock").exists()
-        if is_yarn and not which("yarn"):
+        # A single scandir pass over the project root instead of one stat
+        # per probed file name.
+        try:
+            with os.scandir(abs_path) as entries:
+                root_names = {entry.name for entry in entries}
+        except OSError:
+            root_names = set()
+        is_yarn = "yarn.lock" in root_names
+        if is_yarn and not _cached_which("yarn"):
             log.warning("yarn not found, ignoring yarn.lock file")
             is_yarn = False
 
@@ -105,91 +184,251 @@ def npm_builder(
 
     npm_cmd = normalize_cmd(npm)
 
-    if build_dir and source_dir and not force:
-        should_build = is_stale(build_dir, source_dir)
-    else:
-        should_build = True
+    def builder() -> None:
+        if build_dir and source_dir and not force:
+            should_build = is_stale(build_dir, source_dir)
+        else:
+            should_build = True
 
-    if should_build:
-        log.info("Installing build dependencies with npm.  This may take a while...")
-        run([*npm_cmd, "install"], cwd=str(abs_path))
-        if build_cmd:
-            run([*npm_cmd, "run", build_cmd], cwd=str(abs_path))
-    else:
-        log.info("No build required")
+        if should_build:
+            log.info("Installing build dependencies with npm.  This may take a while...")
+            run([*npm_cmd, "install"], cwd=str(abs_path))
+            if parallel_cmds:
+                _run_parallel([[*npm_cmd, "run", c] for c in parallel_cmds], cwd=str(abs_path))
+            if build_cmd:
+                run([*npm_cmd, "run", build_cmd], cwd=str(abs_path))
+            if build_dir:
+                _update_build_stamp(build_dir)
+        else:
+            log.info("No build required")
+
+    return builder
+
+
+def _run_parallel(cmds: list[list[str]], cwd: str) -> None:
+    """Spawn independent commands concurrently and wait for all of them.
+
+    The wall time of the group is that of its slowest member instead of
+    the sum.  Raises CalledProcessError for the first failed command.
+    """
+    import subprocess
 
+    log = _get_log()
+    procs = []
+    for cmd in cmds:
+        if log.isEnabledFor(logging.INFO):
+            log.info("> %s", list2cmdline(cmd))
+        procs.append((cmd, subprocess.Popen(cmd, cwd=cwd)))
+    results = [(cmd, proc.wait()) for cmd, proc in procs]
+    for cmd, returncode in results:
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, cmd)
+
+
+def _update_build_stamp(build_dir: str | Path) -> None:
+    """Record a successful build so the next staleness check can skip
+    walking the build directory."""
+    stamp = Path(build_dir) / STAMP_FILE_NAME
+    try:
+        stamp.touch()
+    except OSError:
+        _get_log().warning("Could not write build stamp %s", stamp)
 
-def is_stale(target: str | Path, source: str | Path) -> bool:
+
+def is_stale(
+    target: str | Path, source: str | Path, skip_dirs: Container[str] = SKIP_DIRNAMES
+) -> bool:
     """Test whether the target file/directory is stale based on the source
     file/directory.
+
+    Directories named in skip_dirs are pruned from both scans.
     """
     if not Path(source).exists():
         return False
     if not Path(target).exists():
         return True
-    target_mtime = recursive_mtime(target) or 0
-    return compare_recursive_mtime(source, cutoff=target_mtime)
-
-
-def compare_recursive_mtime(path: str | Path, cutoff: float, newest: bool = True) -> bool:
+    # A stamp file written after the last successful build stands in for the
+    # newest mtime of the whole target tree, skipping the target walk.
+    stamp = Path(target) / STAMP_FILE_NAME
+    if stamp.is_file():
+        target_mtime: float | None = stamp.stat().st_mtime
+        source_mtime = _walk_mtime(source, cutoff=target_mtime, skip_dirs=skip_dirs)
+    else:
+        # Walk the target in a worker thread while scanning the source on
+        # this one; both are bound by syscall latency, which releases the
+        # GIL.  Once the target's newest mtime is known, the source scan
+        # has its cutoff and returns on the first newer file.
+        from concurrent.futures import ThreadPoolExecutor
+
+        src = str(source)
+        if os.path.isfile(src):  # noqa: PTH113
+            source_iter: Iterator[float] = iter((os.stat(src).st_mtime,))  # noqa: PTH116
+        else:
+            source_iter = _iter_mtimes(src, skip_dirs)
+        target_mtime = None
+        source_mtime = None
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            target_future = pool.submit(_walk_mtime, target, skip_dirs=skip_dirs)
+            for mt in source_iter:
+                if source_mtime is None or mt > source_mtime:
+                    source_mtime = mt
+                if target_mtime is None and target_future.done():
+                    target_mtime = target_future.result() or 0
+                if target_mtime is not None and source_mtime > target_mtime:
+                    return True
+            if target_mtime is None:
+                target_mtime = target_future.result()
+    if target_mtime is None:
+        target_mtime = 0
+    return source_mtime is not None and source_mtime > target_mtime
+
+
+def _walk_mtime(
+    root: str | Path,
+    cutoff: float | None = None,
+    newest: bool = True,
+    skip_dirs: Container[str] = SKIP_DIRNAMES,
+) -> float | None:
+    """Scan the mtimes of all files under root in a single pass.
+
+    Without a cutoff, the newest (or oldest) mtime is returned.  With a
+    cutoff, the scan short-circuits and returns the first mtime found past
+    the cutoff.  Returns None if no files were seen.
+    """
+    root = str(root)
+    if os.path.isfile(root):  # noqa: PTH113
+        return os.stat(root).st_mtime  # noqa: PTH116
+    extreme = None
+    for mt in _iter_mtimes(root, skip_dirs):
+        if cutoff is not None and (mt > cutoff if newest else mt < cutoff):
+            return mt
+        if extreme is None or (mt > extreme if newest else mt < extreme):
+            extreme = mt
+    return extreme
+
+
+def _iter_mtimes(root: str, skip_dirs: Container[str] = SKIP_DIRNAMES) -> Iterator[float]:
+    """Yield the mtime of every file under root, pruning skip_dirs."""
+    if hasattr(os, "fwalk"):
+        # fwalk holds a directory fd per level, so each stat resolves a bare
+        # filename relative to the fd instead of re-walking the full path.
+        walker = os.fwalk(root)
+        try:
+            first = next(walker)
+        except (OSError, StopIteration):
+            # os.walk silently ignores a missing or unreadable top directory
+            # where fwalk raises; keep the old contract.  Deeper errors are
+            # already swallowed by fwalk's default onerror.
+            return
+        for _dirpath, dirnames, filenames, dirfd in chain((first,), walker):
+            dirnames[:] = [d for d in dirnames if d not in skip_dirs]
+            for filename in filenames:
+                try:
+                    mt = os.stat(  # noqa: PTH116
+                        filename, dir_fd=dirfd, follow_symlinks=False
+                    ).st_mtime
+                except OSError:
+                    # A file can vanish between readdir and stat; skip it
+                    # rather than truncating the rest of the scan.
+                    continue
+                yield mt
+    else:  # pragma: no cover
+        pending = deque([root])
+        while pending:
+            try:
+                entries = os.scandir(pending.popleft())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip_dirs:
+                            pending.append(entry.path)
+                    else:
+                        try:
+                            mt = entry.stat(follow_symlinks=False).st_mtime
+                        except OSError:
+                            continue
+                        yield mt
+
+
+def compare_recursive_mtime(
+    path: str | Path, cutoff: float, newest: bool = True, skip_dirs: Container[str] = ()
+) -> bool:
     """Compare the newest/oldest mtime for all files in a directory.
     Cutoff should be another mtime to be compared against. If an mtime that is
     newer/older than the cutoff is found it will return True.
     E.g. if newest=True, and a file in path is newer than the cutoff, it will
     return True.
+
+    Directories named in skip_dirs are pruned from the scan; unlike
+    is_stale, nothing is pruned by default.
     """
-    path = Path(path)
-    if path.is_file():
-        mt = mtime(path)
-        if newest:
-            if mt > cutoff:
-                return True
-        elif mt < cutoff:
-            return True
-    for dirname, _, filenames in os.walk(str(path), topdown=False):
-        for filename in filenames:
-            mt = mtime(Path(dirname) / filename)
-            if newest:  # Put outside of loop?
-                if mt > cutoff:
-                    return True
-            elif mt < cutoff:
-                return True
-    return False
-
-
-def recursive_mtime(path: str | Path, newest: bool = True) -> float:
-    """Gets the newest/oldest mtime for all files in a directory."""
-    path = Path(path)
-    if path.is_file():
-        return mtime(path)
-    current_extreme = -1.0
-    for dirname, _, filenames in os.walk(str(path), topdown=False):
-        for filename in filenames:
-            mt = mtime(Path(dirname) / filename)
-            if newest:  # Put outside of loop?
-                if mt >= (current_extreme or mt):
-                    current_extreme = mt
-            elif mt <= (current_extreme or mt):
-                current_extreme = mt
-    return current_extreme
+    mt = _walk_mtime(path, cutoff=cutoff, newest=newest, skip_dirs=skip_dirs)
+    if mt is None:
+        return False
+    return mt > cutoff if newest else mt < cutoff
+
+
+def recursive_mtime(
+    path: str | Path,
+    newest: bool = True,
+    early_exit_cutoff: float | None = None,
+    skip_dirs: Container[str] = (),
+) -> float:
+    """Gets the newest/oldest mtime for all files in a directory.
+
+    If early_exit_cutoff is given, the scan stops at the first mtime found
+    beyond the cutoff instead of visiting the rest of the tree.
+    Directories named in skip_dirs are pruned from the scan; unlike
+    is_stale, nothing is pruned by default.
+    """
+    mt = _walk_mtime(path, cutoff=early_exit_cutoff, newest=newest, skip_dirs=skip_dirs)
+    return -1.0 if mt is None else mt
 
 
 def mtime(path: str | Path) -> float:
     """shorthand for mtime"""
-    return Path(path).stat().st_mtime
+    return os.stat(path).st_mtime  # noqa: PTH116
 
 
+@functools.lru_cache(maxsize=None)
 def get_build_func(build_func_str: str) -> Callable[..., None]:
-    """Get a build function by name."""
+    """Get a build function by name.
+
+    The resolution is memoized for the lifetime of the process, so repeated
+    hatch invocations (per target, per phase) only pay the import once.
+    """
+    import importlib
+    import importlib.util
+
     # Get the build function by importing it.
     mod_name, _, func_name = build_func_str.rpartition(".")
 
-    # If the module fails to import, try importing as a local script.
-    try:
-        sys.path.insert(0, str(Path.cwd()))
-        mod = importlib.import_module(mod_name)
-    finally:
-        sys.path.pop(0)
+    # A script in the current directory shadows installed modules, matching
+    # the old cwd-on-sys.path behavior, but loading it from a spec avoids
+    # mutating sys.path and invalidating the importer caches.
+    local_script = Path.cwd() / f"{mod_name}.py"
+    if local_script.is_file():
+        spec = importlib.util.spec_from_file_location(mod_name, local_script)
+        if spec is None or spec.loader is None:  # pragma: no cover
+            msg = f"Could not load local script {local_script}"
+            raise ImportError(msg)
+        mod = importlib.util.module_from_spec(spec)
+        sys.modules[mod_name] = mod
+        spec.loader.exec_module(mod)
+    else:
+        try:
+            mod = importlib.import_module(mod_name)
+        except ModuleNotFoundError:
+            # Local packages (e.g. "scripts.builder.func") used to resolve
+            # through cwd sitting on sys.path; fall back to that behavior
+            # only when the plain import fails.
+            try:
+                sys.path.insert(0, str(Path.cwd()))
+                mod = importlib.import_module(mod_name)
+            finally:
+                sys.path.pop(0)
 
     return cast(Callable[..., None], getattr(mod, func_name))
 
@@ -197,10 +436,12 @@ def get_build_func(build_func_str: str) -> Callable[..., None]:
 def normalize_cmd(cmd: str | list[Any]) -> list[str]:
     """Normalize a subprocess command."""
     if not isinstance(cmd, (list, tuple)):
+        import shlex
+
         cmd = shlex.split(cmd, posix=os.name != "nt")
-    if not Path(cmd[0]).is_absolute():
+    if not os.path.isabs(cmd[0]):  # noqa: PTH117
         # If a command is not an absolute path find it first.
-        cmd_path = which(cmd[0])
+        cmd_path = _cached_which(cmd[0])
         if not cmd_path:
             msg = (
                 f"Aborting. Could not find cmd ({cmd[0]}) in path. "
@@ -214,21 +455,23 @@ def normalize_cmd(cmd: str | list[Any]) -> list[str]:
 
 def normalize_kwargs(kwargs: Mapping[str, Any]) -> dict[str, Any]:
     """Normalize the key names in a kwargs input dictionary"""
-    result = {}
-    for key, value in kwargs.items():
-        if isinstance(value, bool):
-            value = str(value)  # noqa: PLW2901
-        result[key.replace("-", "_")] = value
-    return result
+    return {
+        key.replace("-", "_"): str(value) if isinstance(value, bool) else value
+        for key, value in kwargs.items()
+    }
 
 
 def run(cmd: str | list[Any], **kwargs: Any) -> int:
     """Echo a command before running it."""
-    kwargs.setdefault("shell", os.name == "nt")
+    import subprocess
+
+    # normalize_cmd already resolved cmd[0] to an absolute path, so no
+    # intermediary shell is needed on any platform.
     cmd = normalize_cmd(cmd)
     log = _get_log()
-    log.info("> %s", list2cmdline(cmd))
-    return subprocess.check_call(cmd, **kwargs)
+    if log.isEnabledFor(logging.INFO):
+        log.info("> %s", list2cmdline(cmd))
+    return subprocess.run(cmd, check=True, **kwargs).returncode
 
 
 def ensure_targets(ensured_targets: list[str]) -> None:
@@ -1,5 +1,15 @@
 import pytest
 
+from hatch_jupyter_builder import utils
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    # Process-lifetime caches in utils must not leak between tests.
+    utils.get_build_func.cache_clear()
+    utils._which_cache.clear()
+    utils._skip_npm_cli = None
+
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -1,6 +1,7 @@
 from pytest import fixture  # noqa: PT013
 
 from hatch_jupyter_builder import is_stale
+from hatch_jupyter_builder.utils import STAMP_FILE_NAME
 
 
 @fixture()
@@ -106,6 +107,25 @@ def test_empty_dir(source_dir, tmpdir):
     assert is_stale(str(empty_dir), str(empty_dir)) is False
 
 
+def test_node_modules_does_not_cause_stale(source_dir, destination_dir):
+    source_dir.join("node_modules", "lol", "index.js").setmtime(30000)
+    assert is_stale(str(destination_dir), str(source_dir)) is False
+    # Opting out of pruning brings the subtree back into the scan.
+    assert is_stale(str(destination_dir), str(source_dir), skip_dirs=frozenset()) is True
+
+
+def test_stamp_file_stands_in_for_target_mtime(source_dir, destination_dir):
+    stamp = destination_dir.join(STAMP_FILE_NAME)
+    stamp.write("")
+    stamp.setmtime(50000)
+    # Even though target files are older than the source, the stamp wins.
+    source_dir.join("file1.txt").setmtime(30000)
+    assert is_stale(str(destination_dir), str(source_dir)) is False
+    # A source file newer than the stamp still triggers a rebuild.
+    source_dir.join("file1.txt").setmtime(60000)
+    assert is_stale(str(destination_dir), str(source_dir)) is True
+
+
 def test_missing_dir(source_dir, destination_dir):
     assert not is_stale(destination_dir, "does_not_exist")
     assert is_stale("does_not_exist", source_dir)
@@ -4,7 +4,7 @@ from unittest.mock import call
 
 import pytest
 
-from hatch_jupyter_builder import npm_builder
+from hatch_jupyter_builder import make_builder, npm_builder, utils
 
 
 @pytest.fixture()
@@ -37,8 +37,11 @@ def test_npm_build_skip(mocker, repo):
     del os.environ["HATCH_JUPYTER_BUILDER_SKIP_NPM"]
 
     sys.argv = [*sys.argv, "--skip-npm"]
+    # The CLI flag is latched on first use; force a re-scan of sys.argv.
+    utils._skip_npm_cli = None
     npm_builder("wheel", "standard", path=repo)
     run.assert_not_called()
+    assert "--skip-npm" not in sys.argv
 
 
 def test_npm_builder_yarn(mocker, repo):
@@ -116,6 +119,42 @@ def test_npm_builder_npm_build_command_none(mocker, repo):
     run.assert_has_calls([call(["npm", "install"], cwd=str(repo))])
 
 
+def test_npm_builder_parallel_cmds(mocker, repo):
+    which = mocker.patch("hatch_jupyter_builder.utils.which")
+    run = mocker.patch("hatch_jupyter_builder.utils.run")
+    popen = mocker.patch("subprocess.Popen")
+    popen.return_value.wait.return_value = 0
+    which.return_value = "foo"
+    npm_builder("wheel", "standard", path=repo, parallel_cmds=["lint", "build:themes"])
+    popen.assert_has_calls(
+        [
+            call(["foo", "run", "lint"], cwd=str(repo)),
+            call(["foo", "run", "build:themes"], cwd=str(repo)),
+        ],
+        any_order=True,
+    )
+    run.assert_has_calls(
+        [
+            call(["foo", "install"], cwd=str(repo)),
+            call(["foo", "run", "build"], cwd=str(repo)),
+        ]
+    )
+
+
+def test_npm_builder_writes_stamp(mocker, repo):
+    which = mocker.patch("hatch_jupyter_builder.utils.which")
+    run = mocker.patch("hatch_jupyter_builder.utils.run")
+    which.return_value = "foo"
+    source_dir = repo / "src"
+    build_dir = repo / "build"
+    os.makedirs(source_dir)
+    os.makedirs(build_dir)
+    source_dir.joinpath("index.ts").write_text("let foo;")
+    npm_builder("wheel", "standard", path=repo, build_dir=build_dir, source_dir=source_dir)
+    run.assert_called()
+    assert build_dir.joinpath(utils.STAMP_FILE_NAME).exists()
+
+
 def test_npm_builder_not_stale(mocker, repo):
     which = mocker.patch("hatch_jupyter_builder.utils.which")
     run = mocker.patch("hatch_jupyter_builder.utils.run")
@@ -126,6 +165,23 @@ def test_npm_builder_not_stale(mocker, repo):
     run.assert_not_called()
 
 
+def test_make_builder(mocker, repo):
+    which = mocker.patch("hatch_jupyter_builder.utils.which")
+    run = mocker.patch("hatch_jupyter_builder.utils.run")
+    which.return_value = "foo"
+    builder = make_builder("wheel", "standard", path=repo)
+    builder()
+    builder()
+    run.assert_has_calls(
+        [
+            call(["foo", "install"], cwd=str(repo)),
+            call(["foo", "run", "build"], cwd=str(repo)),
+            call(["foo", "install"], cwd=str(repo)),
+            call(["foo", "run", "build"], cwd=str(repo)),
+        ]
+    )
+
+
 def test_npm_builder_no_npm(mocker, repo):
     which = mocker.patch("hatch_jupyter_builder.utils.which")
     run = mocker.patch("hatch_jupyter_builder.utils.run")
@@ -11,6 +11,7 @@ from hatchling.metadata.core import ProjectMetadata
 from hatchling.plugin.manager import PluginManager
 
 from hatch_jupyter_builder.plugin import JupyterBuildHook
+from hatch_jupyter_builder.utils import get_build_func
 
 
 def test_build_hook(tmp_path):
@@ -71,6 +72,7 @@ def foo(target_name, version, foo_bar=None, fizz_buzz=None):
     test.write_text(text, encoding="utf-8")
     # Force a re-import
     del sys.modules["test"]
+    get_build_func.cache_clear()
 
     hook = JupyterBuildHook(tmp_path, config, {}, meta, tmp_path, "wheel")
     with pytest.raises(RuntimeError):
@@ -55,6 +55,38 @@ def test_get_build_func(tmp_path):
 
     del sys.modules["test"]
 
+    # A local package resolves too, not just a single-file script.
+    pkg = Path("pkg")
+    pkg.mkdir()
+    pkg.joinpath("__init__.py").write_text("", encoding="utf-8")
+    pkg.joinpath("mod.py").write_text(text, encoding="utf-8")
+    callback = utils.get_build_func("pkg.mod.foo")
+    assert callback("fizz", "buzz") == "fizz"
+
+    del sys.modules["pkg.mod"]
+    del sys.modules["pkg"]
+
+
+def test_recursive_mtime_missing_path(tmp_path):
+    missing = str(tmp_path / "does_not_exist")
+    assert utils.recursive_mtime(missing) == -1.0
+    assert utils.compare_recursive_mtime(missing, cutoff=0) is False
+
+
+def test_recursive_mtime_skip_dirs(tmp_path):
+    bundle = tmp_path / "dist" / "bundle.js"
+    bundle.parent.mkdir()
+    bundle.touch()
+    os.utime(bundle, (10000, 10000))
+    # The standalone helpers prune nothing unless asked to.
+    assert utils.recursive_mtime(str(tmp_path)) == 10000
+    assert utils.recursive_mtime(str(tmp_path), skip_dirs=utils.SKIP_DIRNAMES) == -1.0
+    assert utils.compare_recursive_mtime(str(tmp_path), cutoff=5000) is True
+    assert (
+        utils.compare_recursive_mtime(str(tmp_path), cutoff=5000, skip_dirs=utils.SKIP_DIRNAMES)
+        is False
+    )
+
 
 def test_should_skip(tmp_path):
     assert not utils.should_skip("a")